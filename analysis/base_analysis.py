@@ -1,9 +1,17 @@
 import pandas as pd
+import numpy as np
 from abc import ABC, abstractmethod
+from utils.date_utils import fast_to_datetime
 
 class BaseAnalysis(ABC):
     """Abstract base class for water quality analysis"""
     
+    # Set by each station subclass
+    PARAM_ORDER = []
+    _PCODE_TO_COL = {}
+    
+    REQUIRED_COLUMNS = ['Station_ID', 'Date_Time', 'PCode', 'Result']
+    
     def __init__(self, station_name: str):
         self.station_name = station_name
     
@@ -36,18 +44,110 @@ class BaseAnalysis(ABC):
             raise ValueError(f"Missing required columns: {missing_cols}")
         return True
     
+    def process_group(self, group: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process raw rows already restricted to this station
+        
+        Args:
+            group: Station rows, e.g. one group of df.groupby('Station_ID')
+        
+        Returns:
+            pd.DataFrame: Processed analysis data with pivoted structure
+        """
+        self.validate_input(group, self.REQUIRED_COLUMNS)
+        
+        # Own copy of the needed columns; cleaning edits it in place
+        df = group.loc[:, self.REQUIRED_COLUMNS].copy()
+        
+        if df.empty:
+            raise ValueError(f"No data found for {self.station_name} station")
+        
+        # Clean and prepare data
+        df = self._clean_raw_data(df)
+        
+        # Pivot data
+        output_df = self._pivot_data(df)
+        
+        return output_df
+    
+    def _clean_raw_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean raw data before pivoting
+        
+        Modifies df in place; process_group() passes in its own copy.
+        
+        Args:
+            df: Raw DataFrame
+        
+        Returns:
+            pd.DataFrame: Cleaned DataFrame
+        """
+        # Strip whitespace from column names and string columns
+        df.columns = df.columns.str.strip()
+        df['PCode'] = self._encode_codes(df['PCode'])
+        
+        # Truncate Date_Time to a day bucket (stays datetime64)
+        df['Date'] = fast_to_datetime(df['Date_Time']).dt.floor('D')
+        
+        return df
+    
+    def _pivot_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pivot data from long format to wide format
+        
+        Args:
+            df: Cleaned DataFrame in long format
+        
+        Returns:
+            pd.DataFrame: Pivoted DataFrame with Data 1-25 columns, in
+            (Station, Dates) order with Dates kept as datetime64
+        """
+        # Integer key per station-date row; NaN keys get no row
+        station_codes, stations = pd.factorize(df['Station_ID'], sort=True)
+        date_codes, dates = pd.factorize(df['Date'], sort=True)
+        valid = (station_codes >= 0) & (date_codes >= 0)
+        keys = station_codes[valid].astype(np.int64) * len(dates) + date_codes[valid]
+        
+        # Stable sort makes each group a contiguous block, so the fill below
+        # writes the output matrix sequentially; later duplicates still win
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        new_group = np.diff(keys, prepend=-1) != 0
+        group_keys = keys[new_group]
+        row_ids = np.cumsum(new_group) - 1
+        
+        # Parameter column id per record; unknown codes map to -1
+        col_ids = df['PCode'].cat.set_categories(self.PARAM_ORDER).cat.codes.to_numpy()
+        
+        data = self._fill_matrix(
+            row_ids,
+            col_ids[valid][order],
+            df['Result'].to_numpy(dtype=np.float64)[valid][order],
+            n_rows=len(group_keys),
+            n_cols=len(self.PARAM_ORDER)
+        )
+        
+        output_df = pd.DataFrame(
+            data, columns=[self._PCODE_TO_COL[p] for p in self.PARAM_ORDER]
+        )
+        output_df.insert(0, 'Dates', dates[group_keys % len(dates)])
+        output_df.insert(0, 'Station', np.asarray(stations)[group_keys // len(dates)])
+        
+        return output_df
+    
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Common data cleaning operations
         
+        No defensive copy is taken: drop_duplicates already returns a new
+        frame, so the caller's DataFrame is left untouched.
+        
         Args:
             df: DataFrame to clean
         
         Returns:
             pd.DataFrame: Cleaned DataFrame
         """
-        df = df.copy()
-        
         # Remove duplicates
         df = df.drop_duplicates()
         
@@ -56,10 +156,69 @@ class BaseAnalysis(ABC):
         
         # Convert date column if exists
         if 'Dates' in df.columns:
-            df['Dates'] = pd.to_datetime(df['Dates'], errors='coerce')
+            df['Dates'] = fast_to_datetime(df['Dates'], errors='coerce')
         
         return df
     
+    def _encode_codes(self, codes: pd.Series) -> pd.Series:
+        """
+        Strip and upper-case parameter codes as a categorical
+        
+        Only the distinct codes are cleaned, then the row codes are remapped,
+        so the work scales with the number of parameters rather than rows.
+        
+        Args:
+            codes: Raw PCode column
+        
+        Returns:
+            pd.Series: Categorical Series of normalized codes
+        """
+        row_codes, uniques = pd.factorize(codes)
+        cleaned = pd.Index(uniques).str.strip().str.upper()
+        categories = cleaned.dropna().unique()
+        remap = categories.get_indexer(cleaned)
+        
+        return pd.Series(
+            pd.Categorical.from_codes(
+                np.where(row_codes >= 0, remap[row_codes], -1),
+                categories=categories
+            ),
+            index=codes.index,
+            name=codes.name
+        )
+    
+    @staticmethod
+    def _fill_matrix(row_ids: np.ndarray, col_ids: np.ndarray, values: np.ndarray,
+                     n_rows: int, n_cols: int) -> np.ndarray:
+        """
+        Scatter long-format values into a dense wide matrix
+        
+        Negative column ids are skipped. When a cell is hit more than once
+        the later record wins, as in the original row-by-row fill.
+        
+        Args:
+            row_ids: Output row index per record
+            col_ids: Output column index per record
+            values: Value per record
+            n_rows: Number of output rows
+            n_cols: Number of output columns
+        
+        Returns:
+            np.ndarray: (n_rows, n_cols) float64 matrix, NaN where unset
+        """
+        keep = col_ids >= 0
+        cells = row_ids[keep].astype(np.int64) * n_cols + col_ids[keep]
+        values = values[keep]
+        
+        # NumPy leaves repeated fancy-index writes unordered, so keep only the
+        # last record per cell before scattering
+        _, last_from_end = np.unique(cells[::-1], return_index=True)
+        last = len(cells) - 1 - last_from_end
+        
+        out = np.full(n_rows * n_cols, np.nan)
+        out[cells[last]] = values[last]
+        return out.reshape(n_rows, n_cols)
+    
     def get_numeric_columns(self, df: pd.DataFrame) -> list:
         """
         Get list of numeric columns excluding date columns
@@ -70,8 +229,5 @@ class BaseAnalysis(ABC):
         Returns:
             list: Numeric column names
         """
-        return [
-            col for col in df.columns 
-            if pd.api.types.is_numeric_dtype(df[col]) 
-            and col.lower() not in ['date', 'dates']
-        ]
\ No newline at end of file
+        numeric = df.select_dtypes(include='number').columns
+        return [col for col in numeric if col.lower() not in ('date', 'dates')]
\ No newline at end of file
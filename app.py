@@ -25,6 +25,12 @@ if 'uploaded' not in st.session_state:
 if 'current_station' not in st.session_state:
     st.session_state.current_station = None
 
+# Analyzer class for each supported station
+STATION_ANALYZERS = {
+    "CT": CTAnalysis,
+    "TUS": TUSAnalysis
+}
+
 def init_clients():
     """Initialize BigQuery client"""
     return BigQueryClient()
@@ -43,23 +49,22 @@ def process_and_upload_data(uploaded_file, bq_client):
             st.error("File must contain 'Station_ID' column")
             return False
         
-        stations = df['Station_ID'].unique()
+        # Integer-coded station ids make the split compare codes, not strings
+        df['Station_ID'] = df['Station_ID'].astype('category')
         
-        # Process each station
-        for station in stations:
-            if station == 'CT':
-                analyzer = CTAnalysis()
-                table_id = settings.bigquery.ct_table
-            elif station == 'TUS':
-                analyzer = TUSAnalysis()
-                table_id = settings.bigquery.tus_table
-            else:
+        # Single pass over the upload, dispatching each station's rows
+        for station, group in df.groupby('Station_ID', sort=False, observed=True):
+            analyzer_cls = STATION_ANALYZERS.get(station)
+            if analyzer_cls is None:
                 st.warning(f"Unknown station: {station}. Skipping...")
                 continue
             
+            analyzer = analyzer_cls()
+            table_id = settings.station_tables[station]
+            
             try:
                 # Process station data
-                processed_df = analyzer.process(df)
+                processed_df = analyzer.process_group(group)
                 
                 # Upload to BigQuery
                 success = bq_client.upload_dataframe(processed_df, table_id)
@@ -80,14 +85,32 @@ def load_station_data(bq_client, station, start_date, end_date):
     """Load data for selected station and date range"""
     table_id = settings.station_tables[station]
     
-    # Check if table exists
-    if not bq_client.table_exists(table_id):
+    # One metadata fetch covers both the existence and the schema check
+    try:
+        table = bq_client.get_table(table_id)
+    except Exception as e:
+        st.error(f"Error loading {station} table: {str(e)}")
+        return None
+    
+    if table is None:
         st.warning(f"No data available for {station} station. Please upload data first.")
         return None
     
+    # Tables written before Dates became a DATE column cannot take the
+    # DATE-typed range parameters
+    dates_type = next(
+        (field.field_type for field in table.schema if field.name == 'Dates'), None
+    )
+    if dates_type != 'DATE':
+        st.warning(
+            f"{station} data was stored in an older format. "
+            f"Please re-upload {station} data to view it."
+        )
+        return None
+    
     # Build and execute query
-    query = QueryBuilder.get_filtered_data(table_id, start_date, end_date)
-    df = bq_client.query(query)
+    query = QueryBuilder.get_filtered_data(table_id)
+    df = bq_client.query(query, {"start_date": start_date, "end_date": end_date})
     
     return df
 
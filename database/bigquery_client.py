@@ -1,8 +1,10 @@
 import streamlit as st
 import pandas as pd
 from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
 from typing import Optional
 from config.settings import settings
+from utils.date_utils import fast_to_datetime
 
 class BigQueryClient:
     """Class to handle all BigQuery operations"""
@@ -23,9 +25,28 @@ class BigQueryClient:
             bool: True if successful, False otherwise
         """
         try:
+            # Ship Dates as a real DATE rather than a formatted string
+            if 'Dates' in df.columns:
+                df = df.assign(Dates=fast_to_datetime(df['Dates']).dt.date)
+            
             job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_TRUNCATE"
+                write_disposition="WRITE_TRUNCATE",
+                source_format=bigquery.SourceFormat.PARQUET,
+                schema=self._build_schema(df)
             )
+            
+            if 'Dates' in df.columns:
+                # Partition and cluster on Dates so date-range queries prune
+                job_config.time_partitioning = bigquery.TimePartitioning(
+                    type_=bigquery.TimePartitioningType.MONTH,
+                    field="Dates"
+                )
+                job_config.clustering_fields = ["Dates"]
+                
+                if self._is_unpartitioned(table_id):
+                    self._load_and_swap(df, table_id, job_config)
+                    return True
+            
             job = self.client.load_table_from_dataframe(
                 df, table_id, job_config=job_config
             )
@@ -35,24 +56,95 @@ class BigQueryClient:
             st.error(f"Error uploading to BigQuery: {str(e)}")
             return False
     
+    def _is_unpartitioned(self, table_id: str) -> bool:
+        """
+        Check for a table created before partitioning was introduced
+        
+        Args:
+            table_id: Full table ID
+        
+        Returns:
+            bool: True if the table exists without time partitioning
+        """
+        table = self.get_table(table_id)
+        return table is not None and table.time_partitioning is None
+    
+    def _load_and_swap(self, df: pd.DataFrame, table_id: str,
+                       job_config: bigquery.LoadJobConfig):
+        """
+        Replace an unpartitioned table with a partitioned one
+        
+        Neither a load job nor CREATE OR REPLACE can change the partitioning
+        of an existing table, so the data is loaded into a staging table
+        first. The live table is only dropped once that load succeeds, then
+        recreated by a copy job, which keeps the partitioning and clustering.
+        If the copy fails the data is still in the staging table.
+        
+        Args:
+            df: DataFrame to upload
+            table_id: Full table ID
+            job_config: Load config with the partitioning and clustering spec
+        """
+        staging_id = f"{table_id}_staging"
+        try:
+            self.client.load_table_from_dataframe(
+                df, staging_id, job_config=job_config
+            ).result()
+        except Exception:
+            self.client.delete_table(staging_id, not_found_ok=True)
+            raise
+        
+        self.client.delete_table(table_id, not_found_ok=True)
+        self.client.copy_table(staging_id, table_id).result()
+        self.client.delete_table(staging_id, not_found_ok=True)
+    
+    @staticmethod
+    def _build_schema(df: pd.DataFrame) -> list:
+        """
+        Build an explicit load schema so BigQuery skips autodetection
+        
+        Args:
+            df: DataFrame about to be uploaded
+        
+        Returns:
+            list: SchemaField per column
+        """
+        schema = []
+        for col in df.columns:
+            if col == 'Dates':
+                field_type = "DATE"
+            elif pd.api.types.is_numeric_dtype(df[col]):
+                field_type = "FLOAT64"
+            else:
+                field_type = "STRING"
+            schema.append(bigquery.SchemaField(col, field_type))
+        return schema
+    
     @st.cache_data(ttl=settings.app.cache_ttl)
-    def query(_self, sql_query: str) -> pd.DataFrame:
+    def query(_self, sql_query: str, params: Optional[dict] = None) -> pd.DataFrame:
         """
         Execute a SQL query and return results as DataFrame
         
         Args:
             sql_query: SQL query string
+            params: Optional DATE query parameters keyed by name
         
         Returns:
             pd.DataFrame: Query results
         """
         try:
-            query_job = _self.client.query(sql_query)
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter(name, "DATE", value)
+                    for name, value in (params or {}).items()
+                ]
+            )
+            query_job = _self.client.query(sql_query, job_config=job_config)
             df = query_job.result().to_dataframe()
             
             # Convert Dates column to datetime if it exists
             if 'Dates' in df.columns:
-                df['Dates'] = pd.to_datetime(df['Dates'])
+                df['Dates'] = fast_to_datetime(df['Dates'])
             
             return df
         except Exception as e:
@@ -76,6 +168,24 @@ class BigQueryClient:
             st.error(f"Error getting table schema: {str(e)}")
             return []
     
+    def get_table(self, table_id: str) -> Optional[bigquery.Table]:
+        """
+        Fetch table metadata in a single API call
+        
+        Only a missing table maps to None; permission and transport errors
+        are raised to the caller.
+        
+        Args:
+            table_id: Full table ID
+        
+        Returns:
+            bigquery.Table or None: Table metadata or None if it does not exist
+        """
+        try:
+            return self.client.get_table(table_id)
+        except NotFound:
+            return None
+    
     def table_exists(self, table_id: str) -> bool:
         """
         Check if a table exists in BigQuery
@@ -1,25 +1,28 @@
-from datetime import date
+# Columns written by the station analyzers' pivot step
+OUTPUT_COLUMNS = ['Station', 'Dates'] + [f'Data {i}' for i in range(1, 26)]
 
 class QueryBuilder:
     """Class to build SQL queries for water quality data"""
     
     @staticmethod
-    def get_filtered_data(table_id: str, start_date: date, end_date: date) -> str:
+    def get_filtered_data(table_id: str) -> str:
         """
         Build query to get filtered data by date range
         
+        The range is bound through @start_date / @end_date DATE parameters so
+        the SQL text stays identical and BigQuery's result cache can hit.
+        
         Args:
             table_id: Full table ID
-            start_date: Start date for filter
-            end_date: End date for filter
         
         Returns:
             str: SQL query
         """
+        select_list = ", ".join(f"`{col}`" for col in OUTPUT_COLUMNS)
         return f"""
-        SELECT *
+        SELECT {select_list}
         FROM `{table_id}`
-        WHERE DATE(Dates) BETWEEN '{start_date}' AND '{end_date}'
+        WHERE Dates BETWEEN @start_date AND @end_date
         ORDER BY Dates
         """
     
@@ -2,6 +2,19 @@ import streamlit as st
 import pandas as pd
 from typing import List, Tuple, Optional
 from datetime import datetime, date
+from config.settings import settings
+from utils.data_processor import DataProcessor
+
+@st.cache_data(ttl=settings.app.cache_ttl)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize DataFrame to CSV once per distinct frame, not on every rerun"""
+    # Day-level Dates are written as YYYY-MM-DD by the Arrow writer
+    return DataProcessor.prepare_for_download(df, file_format="csv")
+
+@st.cache_data(ttl=settings.app.cache_ttl)
+def _describe(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Same table as df[columns].describe(), cached per frame and column set"""
+    return DataProcessor.calculate_statistics(df, columns, percentiles=True)
 
 class Sidebar:
     """Class to manage sidebar components"""
@@ -74,7 +87,7 @@ class Sidebar:
         """
         st.sidebar.header("💾 Download")
         
-        csv = df.to_csv(index=False).encode('utf-8')
+        csv = _to_csv_bytes(df)
         st.sidebar.download_button(
             label="Download Filtered Data as CSV",
             data=csv,
@@ -177,4 +190,4 @@ class DataDisplay:
             columns: Columns to summarize
         """
         with st.expander("📊 Statistical Summary"):
-            st.dataframe(df[columns].describe(), use_container_width=True)
\ No newline at end of file
+            st.dataframe(_describe(df, columns), use_container_width=True)
\ No newline at end of file
@@ -1,6 +1,22 @@
+import warnings
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import streamlit as st
 from typing import Tuple, Optional
+from utils.date_utils import fast_to_datetime
+
+# Candidate date column names, in priority order
+DATE_CANDIDATES = ('Dates', 'Date', 'dates', 'date', 'DATE')
+
+# Uploads above this size are parsed in larger Arrow blocks
+LARGE_UPLOAD_BYTES = 200_000_000
+LARGE_UPLOAD_BLOCK_SIZE = 64 * 1024 * 1024
+
+# (floor unit, Arrow unit) pairs, coarsest first, for timestamp export
+TIMESTAMP_UNITS = (('second', 's'), ('millisecond', 'ms'), ('microsecond', 'us'))
 
 class DataProcessor:
     """Class to handle data processing operations"""
@@ -18,9 +34,33 @@ class DataProcessor:
         """
         try:
             if uploaded_file.name.endswith(".xlsx"):
-                df = pd.read_excel(uploaded_file)
+                try:
+                    # Rust-based reader, much faster than openpyxl
+                    df = pd.read_excel(uploaded_file, engine="calamine")
+                except ImportError:
+                    uploaded_file.seek(0)
+                    df = pd.read_excel(uploaded_file)
             elif uploaded_file.name.endswith(".csv"):
-                df = pd.read_csv(uploaded_file)
+                read_options = None
+                if uploaded_file.size > LARGE_UPLOAD_BYTES:
+                    # Larger parse blocks keep multi-GB files to a few Arrow chunks
+                    read_options = pacsv.ReadOptions(block_size=LARGE_UPLOAD_BLOCK_SIZE)
+                
+                # Raw Date_Time stays text: Arrow would normalize offset
+                # timestamps to UTC, shifting the day buckets the analyzers
+                # build from local time
+                convert_options = pacsv.ConvertOptions(
+                    column_types={'Date_Time': pa.string()}
+                )
+                
+                # Multithreaded Arrow parser; columns stay Arrow-backed
+                # instead of becoming object arrays
+                table = pacsv.read_csv(
+                    uploaded_file,
+                    read_options=read_options,
+                    convert_options=convert_options
+                )
+                df = table.to_pandas(types_mapper=pd.ArrowDtype)
             else:
                 st.error("Unsupported file format. Please upload Excel or CSV file.")
                 return None
@@ -45,10 +85,10 @@ class DataProcessor:
         if exclude_cols is None:
             exclude_cols = ['date', 'dates']
         
+        excluded = {e.lower() for e in exclude_cols}
         return [
-            col for col in df.columns 
-            if pd.api.types.is_numeric_dtype(df[col]) 
-            and col.lower() not in [e.lower() for e in exclude_cols]
+            col for col in df.select_dtypes(include='number').columns
+            if col.lower() not in excluded
         ]
     
     @staticmethod
@@ -62,11 +102,7 @@ class DataProcessor:
         Returns:
             str or None: Date column name or None if not found
         """
-        date_cols = ['Dates', 'Date', 'dates', 'date', 'DATE']
-        for col in date_cols:
-            if col in df.columns:
-                return col
-        return None
+        return next((col for col in DATE_CANDIDATES if col in df.columns), None)
     
     @staticmethod
     def prepare_for_download(df: pd.DataFrame, file_format: str = "csv") -> bytes:
@@ -81,27 +117,117 @@ class DataProcessor:
             bytes: Encoded file data
         """
         if file_format == "csv":
-            return df.to_csv(index=False).encode('utf-8')
+            import io
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type object columns Arrow cannot type
+                return df.to_csv(index=False).encode('utf-8')
+            
+            # Match pandas' text where Arrow's default differs: booleans as
+            # True/False, timestamps at the coarsest lossless precision and
+            # day-level naive ones as plain dates
+            for i, field in enumerate(table.schema):
+                column = table.column(i)
+                if pa.types.is_boolean(field.type):
+                    table = table.set_column(
+                        i, field.name, pc.if_else(column, 'True', 'False')
+                    )
+                elif pa.types.is_timestamp(field.type):
+                    table = table.set_column(
+                        i, field.name, DataProcessor._coarsest_timestamp(column)
+                    )
+            
+            # Arrow's C++ writer emits UTF-8 bytes directly. Unlike to_csv it
+            # quotes every string and header, writes whole floats without
+            # '.0' and timezone offsets as -0500 rather than -05:00
+            output = io.BytesIO()
+            pacsv.write_csv(table, output)
+            return output.getvalue()
         elif file_format == "excel":
             import io
+            import xlsxwriter
             output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, index=False, sheet_name='Data')
+            
+            # constant_memory flushes each row once the next one starts, so
+            # rows are written in order here; to_excel goes column by column
+            # and would lose data in this mode
+            workbook = xlsxwriter.Workbook(output, {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd'
+            })
+            worksheet = workbook.add_worksheet('Data')
+            worksheet.write_row(0, 0, [str(col) for col in df.columns])
+            
+            # NaN/NaT become None one row at a time, so they are left as blank
+            # cells without building an object copy of the whole frame
+            for row, record in enumerate(df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row, 0, [None if pd.isna(v) else v for v in record])
+            
+            workbook.close()
             return output.getvalue()
     
     @staticmethod
-    def calculate_statistics(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    def _coarsest_timestamp(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Cast a timestamp column to the coarsest unit that loses nothing
+        
+        Arrow writes every digit of the stored unit, so nanosecond columns
+        would otherwise come out as '08:30:00.000000000'.
+        
+        Args:
+            column: Arrow timestamp column
+        
+        Returns:
+            pa.ChunkedArray: date32 for naive day-level values, otherwise a
+            timestamp in whole seconds, milliseconds or microseconds if exact
+        """
+        def exact(unit):
+            return pc.all(pc.equal(pc.floor_temporal(column, unit=unit), column)).as_py()
+        
+        tz = column.type.tz
+        if tz is None and exact('day'):
+            return column.cast(pa.date32())
+        for unit, arrow_unit in TIMESTAMP_UNITS:
+            if exact(unit):
+                return column.cast(pa.timestamp(arrow_unit, tz=tz))
+        return column
+    
+    @staticmethod
+    def calculate_statistics(df: pd.DataFrame, columns: list,
+                             percentiles: bool = False) -> pd.DataFrame:
         """
         Calculate statistics for specified columns
         
         Args:
             df: DataFrame containing data
             columns: List of columns to analyze
+            percentiles: Include 25%/50%/75% quartiles, as describe() does
         
         Returns:
             pd.DataFrame: Statistics summary
         """
-        return df[columns].describe()
+        # Single numpy pass per statistic instead of describe()'s per-column work
+        arr = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        # All-NaN columns legitimately produce NaN stats
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            rows = [
+                np.count_nonzero(~np.isnan(arr), axis=0),
+                np.nanmean(arr, axis=0),
+                np.nanstd(arr, axis=0, ddof=1),
+                np.nanmin(arr, axis=0)
+            ]
+            index = ['count', 'mean', 'std', 'min']
+            if percentiles:
+                rows.append(np.nanpercentile(arr, [25, 50, 75], axis=0))
+                index += ['25%', '50%', '75%']
+            rows.append(np.nanmax(arr, axis=0))
+            index.append('max')
+            stats = np.vstack(rows)
+        
+        return pd.DataFrame(stats, index=index, columns=columns)
     
     @staticmethod
     def filter_by_date_range(df: pd.DataFrame, start_date, end_date, 
@@ -118,7 +244,26 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Filtered DataFrame
         """
-        df = df.copy()
-        df[date_column] = pd.to_datetime(df[date_column])
-        mask = (df[date_column].dt.date >= start_date) & (df[date_column].dt.date <= end_date)
+        dates = df[date_column]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = fast_to_datetime(dates)
+            df = df.assign(**{date_column: dates})
+        
+        if dates.dt.tz is not None:
+            # Compare on local wall-clock days, as .dt.date did; going through
+            # DatetimeIndex keeps Arrow-backed columns in their own timezone
+            dates = pd.DatetimeIndex(dates).tz_localize(None)
+        
+        # Compare against day bounds as datetime64, end exclusive
+        start = np.datetime64(start_date, 'D')
+        end = np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+        
+        # Time series usually arrive sorted: binary-search the slice bounds
+        if dates.is_monotonic_increasing:
+            lo = dates.searchsorted(start, side='left')
+            hi = dates.searchsorted(end, side='left')
+            return df.iloc[lo:hi]
+        
+        values = dates.to_numpy()
+        mask = (values >= start) & (values < end)
         return df[mask]
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pandas as pd
+
+def fast_to_datetime(series: pd.Series, **kwargs) -> pd.Series:
+    """
+    Convert a column to datetime, parsing each distinct value only once
+
+    Raw water quality exports repeat the same timestamp for every PCode in a
+    sample, so the unique values are parsed and broadcast back by position.
+    ISO8601 is tried first to skip per-element format inference.
+
+    Args:
+        series: Series of date strings or datetime-like values
+        **kwargs: Extra arguments for pd.to_datetime (e.g. errors='coerce')
+
+    Returns:
+        pd.Series: datetime64 Series aligned with the input index
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    codes, uniques = pd.factorize(series)
+    try:
+        parsed = pd.to_datetime(uniques, format='ISO8601')
+    except (ValueError, TypeError):
+        parsed = pd.to_datetime(uniques, **kwargs)
+
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+        index=series.index,
+        name=series.name
+    )
@@ -1,7 +1,8 @@
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 class BaseChart(ABC):
     """Abstract base class for all chart types"""
@@ -10,7 +11,17 @@ class BaseChart(ABC):
         self.title = title
         self.xaxis_title = xaxis_title
         self.yaxis_title = yaxis_title
-        self.fig = go.Figure()
+        
+        # Static layout is validated once, when the figure is built
+        self._layout = {
+            'title': self.title,
+            'xaxis_title': self.xaxis_title,
+            'yaxis_title': self.yaxis_title,
+            'hovermode': 'x unified',
+            'template': 'plotly_white',
+            'showlegend': True
+        }
+        self.fig = go.Figure(layout=self._layout)
     
     @abstractmethod
     def create(self, df: pd.DataFrame, columns: List[str], **kwargs) -> go.Figure:
@@ -28,17 +39,53 @@ class BaseChart(ABC):
         pass
     
     def update_layout(self, **kwargs):
-        """Update the figure layout with common settings"""
-        layout_config = {
-            'title': self.title,
-            'xaxis_title': self.xaxis_title,
-            'yaxis_title': self.yaxis_title,
-            'hovermode': 'x unified',
-            'template': 'plotly_white',
-            'showlegend': True
-        }
-        layout_config.update(kwargs)
-        self.fig.update_layout(**layout_config)
+        """Apply layout overrides; the common settings are set in __init__"""
+        if kwargs:
+            self.fig.update_layout(**kwargs)
+    
+    def _decimate(self, x: np.ndarray, y: pd.Series,
+                  n_out: int = 2500) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample a series to about n_out points before it reaches plotly
+        
+        The series is split into n_out // 2 equal bins and the min and max of
+        each bin are kept, so spikes survive where plain striding drops them.
+        
+        Args:
+            x: X values (dates), as prepared by validate_data
+            y: Y values
+            n_out: Target number of points
+        
+        Returns:
+            Tuple of (x, y) numpy arrays, y as float32
+        """
+        # float32 is exact enough on screen and halves the typed-array payload
+        y = y.to_numpy(dtype=np.float32, na_value=np.nan)
+        n = len(y)
+        if n <= n_out:
+            return x, y
+        
+        n_bins = n_out // 2
+        starts = np.linspace(0, n, n_bins + 1).astype(np.int64)[:-1]
+        counts = np.diff(np.append(starts, n))
+        bin_ids = np.repeat(np.arange(n_bins), counts)
+        
+        def first_hit(values, extremes):
+            hits = np.flatnonzero(values == np.repeat(extremes, counts))
+            _, first = np.unique(bin_ids[hits], return_index=True)
+            return hits[first]
+        
+        # NaN never wins a bin; an all-NaN bin keeps its first point
+        missing = np.isnan(y)
+        low = np.where(missing, np.inf, y)
+        high = np.where(missing, -np.inf, y)
+        idx = np.unique(np.concatenate([
+            first_hit(low, np.minimum.reduceat(low, starts)),
+            first_hit(high, np.maximum.reduceat(high, starts)),
+            [0, n - 1]
+        ]))
+        
+        return x[idx], y[idx]
     
     def validate_data(self, df: pd.DataFrame, columns: List[str]):
         """
@@ -54,9 +101,13 @@ class BaseChart(ABC):
         if df.empty:
             raise ValueError("DataFrame is empty")
         
-        missing_cols = [col for col in columns if col not in df.columns]
+        # Hash lookups against the column index instead of a linear scan per column
+        missing_cols = set(columns).difference(df.columns)
         if missing_cols:
-            raise ValueError(f"Missing columns: {missing_cols}")
+            raise ValueError(f"Missing columns: {sorted(missing_cols)}")
         
         if 'Dates' not in df.columns:
-            raise ValueError("DataFrame must have 'Dates' column")
\ No newline at end of file
+            raise ValueError("DataFrame must have 'Dates' column")
+        
+        # Convert the shared x axis once and reuse it for every trace
+        self._x = df['Dates'].to_numpy(dtype='datetime64[ms]')
\ No newline at end of file
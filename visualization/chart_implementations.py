@@ -1,6 +1,6 @@
 import pandas as pd
 import plotly.graph_objects as go
-from typing import List
+from typing import List, Tuple
 from visualization.base_chart import BaseChart
 
 class LineChart(BaseChart):
@@ -10,16 +10,21 @@ class LineChart(BaseChart):
         """Create a line chart"""
         self.validate_data(df, columns)
         
+        traces = []
         for col in columns:
-            self.fig.add_trace(go.Scatter(
-                x=df['Dates'],
-                y=df[col],
+            x, y = self._decimate(self._x, df[col])
+            traces.append(go.Scattergl(
+                x=x,
+                y=y,
                 mode='lines+markers',
                 name=col,
                 line=dict(width=2),
                 marker=dict(size=6)
             ))
         
+        # One add_traces call validates the whole batch at once
+        self.fig.add_traces(traces)
+        
         self.update_layout()
         return self.fig
 
@@ -32,15 +37,16 @@ class ScatterChart(BaseChart):
         self.validate_data(df, columns)
         
         col = columns[0]  # Scatter plot uses single column
-        self.fig.add_trace(go.Scatter(
-            x=df['Dates'],
-            y=df[col],
+        x, y = self._decimate(self._x, df[col])
+        self.fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
             mode='markers',
             name=col,
             marker=dict(
                 size=8,
                 opacity=0.7,
-                color=df[col],
+                color=y,
                 colorscale='Viridis',
                 showscale=True,
                 colorbar=dict(title=col)
@@ -59,12 +65,13 @@ class BarChart(BaseChart):
         self.validate_data(df, columns)
         
         col = columns[0]  # Bar chart uses single column
+        x, y = self._decimate(self._x, df[col])
         self.fig.add_trace(go.Bar(
-            x=df['Dates'],
-            y=df[col],
+            x=x,
+            y=y,
             name=col,
             marker=dict(
-                color=df[col],
+                color=y,
                 colorscale='Blues'
             )
         ))
@@ -80,16 +87,21 @@ class AreaChart(BaseChart):
         """Create an area chart"""
         self.validate_data(df, columns)
         
+        traces = []
         for idx, col in enumerate(columns):
-            self.fig.add_trace(go.Scatter(
-                x=df['Dates'],
-                y=df[col],
+            x, y = self._decimate(self._x, df[col])
+            traces.append(go.Scattergl(
+                x=x,
+                y=y,
                 mode='lines',
                 name=col,
                 fill='tonexty' if idx > 0 else 'tozeroy',
                 line=dict(width=2)
             ))
         
+        # One add_traces call validates the whole batch at once
+        self.fig.add_traces(traces)
+        
         self.update_layout()
         return self.fig
 
@@ -104,6 +116,9 @@ class ChartFactory:
         "Area Chart": AreaChart
     }
     
+    # Built once; returned as-is on every render
+    _AVAILABLE_CHARTS = tuple(CHART_TYPES)
+    
     @staticmethod
     def create_chart(chart_type: str, title: str = "", xaxis_title: str = "Date", 
                      yaxis_title: str = "Value") -> BaseChart:
@@ -122,13 +137,13 @@ class ChartFactory:
         Raises:
             ValueError: If chart type is not supported
         """
-        if chart_type not in ChartFactory.CHART_TYPES:
+        chart_class = ChartFactory.CHART_TYPES.get(chart_type)
+        if chart_class is None:
             raise ValueError(f"Unsupported chart type: {chart_type}")
         
-        chart_class = ChartFactory.CHART_TYPES[chart_type]
         return chart_class(title=title, xaxis_title=xaxis_title, yaxis_title=yaxis_title)
     
     @staticmethod
-    def get_available_charts() -> List[str]:
-        """Get list of available chart types"""
-        return list(ChartFactory.CHART_TYPES.keys())
\ No newline at end of file
+    def get_available_charts() -> Tuple[str, ...]:
+        """Get available chart types"""
+        return ChartFactory._AVAILABLE_CHARTS
\ No newline at end of file